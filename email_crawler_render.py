@@ -8,9 +8,14 @@
 
 import gspread
 from google.oauth2.service_account import Credentials
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import asyncio
+from aiolimiter import AsyncLimiter
+from bs4 import BeautifulSoup, SoupStrainer
+from collections import defaultdict
+from urllib.parse import quote, urljoin, urlparse
 import re
+import shelve
 import time
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -21,8 +26,57 @@ from selenium.webdriver.support import expected_conditions as EC
 import logging
 import os
 import json
+import queue
 import tempfile
 
+# 이메일 정규표현식 패턴 (모듈 로드 시 1회만 컴파일)
+# TLD 클래스의 기존 [A-Z|a-z] 표기는 '|'를 문자로 매칭하는 버그였음.
+# ASCII 전용 입력이므로 re.ASCII로 유니코드 문자 클래스 비용도 제거.
+EMAIL_RE = re.compile(
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,24}\b', re.ASCII
+)
+
+# mailto: 링크 주소 (사이트가 직접 명시한 확정 데이터라 일반 패턴보다 우선)
+MAILTO_RE = re.compile(r'mailto:([^"\'?&\s<>]+)', re.ASCII)
+
+# 수집 대상에서 제외할 포털/검색엔진 도메인 (서브도메인 포함)
+EXCLUDE_DOMAINS_RE = re.compile(
+    r'@(?:[A-Za-z0-9.-]+\.)?(?:naver|google|daum|kakao)\.com$', re.I
+)
+
+# 대표 이메일로 우선할 계정명 (info@, ceo@ 등)
+PRIORITY_RE = re.compile(r'^(?:ceo|info|contact|admin|master)@', re.I)
+
+# 연락처 페이지로 이어지는 링크 텍스트
+CONTACT_LINK_RE = re.compile(r'연락|Contact|회사소개', re.I)
+
+# 이보다 짧은 HTML은 JS 렌더링 페이지로 간주하고 Selenium으로 폴백
+MIN_HTML_LEN = 500
+
+# 연락처가 주로 위치하는 태그만 파싱 (스크립트/스타일 등 나머지는 건너뜀)
+CONTACT_STRAINER = SoupStrainer(['a', 'footer', 'address', 'p'])
+
+# 회사명 정규화 시 제거할 법인 표기 (주식회사, (주), Co.,Ltd. 등)
+# 영문 표기는 단어 경계로 묶어 일반 단어 속 글자를 지우지 않도록 한다
+CORP_MARK_RE = re.compile(
+    r'주식회사|\(주\)|㈜|\b(?:co\.,?\s*ltd|inc|corp)\b\.?', re.I
+)
+
+
+def normalize_company_name(name):
+    """중복 판정용 회사명 정규화: 법인 표기 제거, 공백 제거, 소문자화"""
+    normalized = CORP_MARK_RE.sub('', name)
+    normalized = re.sub(r'\s+', '', normalized).lower()
+    # 법인 표기만으로 된 이름이면 원본을 그대로 사용
+    return normalized or name.strip().lower()
+
+
+# 크롤링 요청에 사용할 User-Agent
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +84,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx의 요청 단위 INFO 로그는 소음이 커서 경고 이상만 남김
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
 
 class EmailCrawler:
     def __init__(self, spreadsheet_key, credentials_json=None):
@@ -43,12 +100,32 @@ class EmailCrawler:
         self.spreadsheet_key = spreadsheet_key
         self.credentials_json = credentials_json
         self.sheet = None
-        self.driver = None
-        
-        # 이메일 정규표현식 패턴
-        self.email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        )
+        # 공유 HTTP 클라이언트 (crawl_all_companies에서 생성/종료)
+        self.client = None
+        # 호스트별 토큰 버킷: 같은 호스트만 서로 대기하고
+        # 다른 홈페이지로의 동시 요청은 막지 않는다
+        self.limiters = defaultdict(lambda: AsyncLimiter(1, 1.0))
+        self.limiters['search.naver.com'] = AsyncLimiter(2, 1.0)
+        # 시트 전체 값 캐시 (세션 내 재실행 시 API 재호출 방지)
+        self._sheet_cache = None
+
+        # 회사명 → 결과 디스크 캐시 (재실행 시 이미 처리한 회사는 네트워크 비용 0)
+        # USE_CACHE=0 으로 비활성화, TTL 경과분은 다시 크롤링
+        self.cache = None
+        self._cache_ttl = int(os.getenv('CACHE_TTL_DAYS', '30')) * 86400
+        # 미발견 결과는 일시적 네트워크 오류일 수 있으므로 짧게 유지
+        self._negative_cache_ttl = int(os.getenv('CACHE_NEGATIVE_TTL_DAYS', '1')) * 86400
+        if os.getenv('USE_CACHE', '1') != '0':
+            try:
+                self.cache = shelve.open(os.getenv('CACHE_FILE', 'email_cache.db'))
+            except Exception as e:
+                logger.warning(f"⚠️ 캐시 파일 열기 실패 (캐시 없이 진행): {e}")
+        # Selenium은 스레드 안전하지 않으므로 드라이버를 풀로 관리
+        # (워커가 get()으로 빌려 쓰고 put()으로 반납)
+        self.drivers = queue.Queue()
+        self._pool_size = 0
+        # 종료 시 대여 중인 드라이버까지 정리하기 위한 전체 목록
+        self._all_drivers = []
     
     def is_valid_email(self, email):
         """
@@ -125,8 +202,39 @@ class EmailCrawler:
             logger.error(f"상세 정보:\n{traceback.format_exc()}")
             return False
     
-    def setup_selenium(self):
-        """Selenium 웹드라이버 설정 (Render 환경 최적화)"""
+    def setup_selenium(self, pool_size=None):
+        """
+        Selenium 드라이버 풀 생성 (Render 환경 최적화)
+
+        드라이버 생성(3~5초)은 시작 시 1회만 부담하고, 이후에는
+        풀에서 빌려 쓰며 수백 페이지에 걸쳐 비용을 상각한다.
+
+        Args:
+            pool_size: 풀에 넣을 드라이버 수 (기본: DRIVER_POOL_SIZE 환경 변수, 4)
+        """
+        if pool_size is None:
+            pool_size = int(os.getenv('DRIVER_POOL_SIZE', '4'))
+
+        created = 0
+        for _ in range(pool_size):
+            driver = self._create_driver()
+            if driver is None:
+                break
+            self.drivers.put(driver)
+            self._all_drivers.append(driver)
+            created += 1
+
+        self._pool_size = created
+
+        if created == 0:
+            logger.error("❌ Selenium 드라이버를 하나도 생성하지 못했습니다")
+            return False
+
+        logger.info(f"✅ Selenium 드라이버 풀 준비 완료 ({created}개)")
+        return True
+
+    def _create_driver(self):
+        """Chrome 드라이버 1개 생성 (SELENIUM_GRID_URL 설정 시 원격 Grid 사용)"""
         try:
             chrome_options = Options()
             
@@ -139,10 +247,12 @@ class EmailCrawler:
             chrome_options.add_argument('--disable-extensions')
             chrome_options.add_argument('--window-size=1280,720')  # 해상도 낮춤
             chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            chrome_options.add_argument(f'user-agent={USER_AGENT}')
             
             # 메모리 최적화 (강화)
-            chrome_options.add_argument('--single-process')
+            # --single-process는 렌더러/브라우저를 한 프로세스로 묶어
+            # 페이지 로드가 전부 직렬화되고 크래시도 잦아 사용하지 않는다
+            chrome_options.add_argument('--memory-pressure-off')
             chrome_options.add_argument('--disable-background-networking')
             chrome_options.add_argument('--disable-background-timer-throttling')
             chrome_options.add_argument('--disable-backgrounding-occluded-windows')
@@ -157,26 +267,38 @@ class EmailCrawler:
             chrome_options.add_argument('--metrics-recording-only')
             chrome_options.add_argument('--mute-audio')
             
-            # 이미지/CSS 로딩 비활성화 (메모리 절약)
+            # 이미지/CSS/폰트 로딩 비활성화 (페이지 로드 바이트 5~10배 절감)
             prefs = {
                 'profile.managed_default_content_settings.images': 2,  # 이미지 차단
                 'profile.managed_default_content_settings.stylesheets': 2,  # CSS 차단
+                'profile.managed_default_content_settings.fonts': 2,  # 폰트 차단
             }
             chrome_options.add_experimental_option('prefs', prefs)
+
+            # DOMContentLoaded 시점에 driver.get 반환 (서브리소스 대기 안 함)
+            chrome_options.page_load_strategy = 'eager'
             
             # 로깅 줄이기
             chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
             chrome_options.add_argument('--log-level=3')
             
+            # 원격 Selenium Grid 사용 (클라우드 확장용)
+            grid_url = os.getenv('SELENIUM_GRID_URL')
+            if grid_url:
+                driver = webdriver.Remote(command_executor=grid_url, options=chrome_options)
+                driver.set_page_load_timeout(15)
+                logger.info(f"✅ Selenium Grid 드라이버 생성: {grid_url}")
+                return driver
+
             # Chromium 바이너리 경로 설정 (Render 환경)
             chrome_binary = os.getenv('CHROME_BIN', '/usr/bin/chromium')
             chromedriver_path = os.getenv('CHROMEDRIVER_PATH', '/usr/bin/chromedriver')
-            
+
             # Chromium 바이너리 위치 지정
             if os.path.exists(chrome_binary):
                 chrome_options.binary_location = chrome_binary
                 logger.info(f"✅ Chrome binary: {chrome_binary}")
-            
+
             # ChromeDriver 서비스 설정
             try:
                 if os.path.exists(chromedriver_path):
@@ -193,210 +315,376 @@ class EmailCrawler:
             except:
                 service = Service()  # 기본 경로 사용
                 logger.info("✅ ChromeDriver: default path")
-            
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.set_page_load_timeout(15)  # 30초 → 15초로 단축
-            
-            logger.info("✅ Selenium 드라이버 설정 완료")
-            return True
+
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver.set_page_load_timeout(15)  # 30초 → 15초로 단축
+
+            return driver
         except Exception as e:
-            logger.error(f"❌ Selenium 설정 실패: {e}")
+            logger.error(f"❌ Selenium 드라이버 생성 실패: {e}")
             import traceback
             logger.error(traceback.format_exc())
-            return False
+            return None
     
-    def search_naver_place(self, company_name):
+    async def fetch(self, url, timeout=10):
         """
-        네이버 플레이스/지도에서 회사 정보 검색
-        
+        공유 HTTP/2 클라이언트로 URL의 HTML 텍스트 가져오기
+
+        Args:
+            url: 요청할 URL
+            timeout: 타임아웃 (초)
+
+        Returns:
+            str: HTML 텍스트 또는 None
+        """
+        try:
+            # 호스트별 속도 제한 (전역 sleep 대신 해당 호스트 요청만 대기)
+            async with self.limiters[urlparse(url).netloc]:
+                response = await self.client.get(
+                    url, timeout=timeout, follow_redirects=True
+                )
+            return response.text
+        except Exception as e:
+            logger.warning(f"HTTP 요청 실패 ({url}): {e}")
+            return None
+
+    async def search_naver_place(self, company_name):
+        """
+        네이버 플레이스/지도에서 회사 정보 검색 (HTTP, Selenium 불필요)
+
         Args:
             company_name: 회사명
-            
+
         Returns:
             dict: {email, homepage, phone}
         """
+        result = {
+            'email': None,
+            'homepage': None,
+            'phone': None
+        }
+
         try:
-            search_url = f"https://search.naver.com/search.naver?query={company_name}"
-            self.driver.get(search_url)
-            time.sleep(2)
-            
-            result = {
-                'email': None,
-                'homepage': None,
-                'phone': None
-            }
-            
-            # 플레이스 정보 찾기
+            search_url = f"https://search.naver.com/search.naver?query={quote(company_name)}"
+            html = await self.fetch(search_url)
+            if not html:
+                return result
+
+            # 플레이스 정보 찾기 (HTML은 한 번만 파싱하고 soup 재사용)
             try:
+                soup = BeautifulSoup(html, 'lxml')
+
                 # 전화번호
-                phone_elements = self.driver.find_elements(By.CSS_SELECTOR, '.tel, .phone, [class*="tel"]')
-                if phone_elements:
-                    result['phone'] = phone_elements[0].text.strip()
-                
+                phone_element = soup.select_one('.tel, .phone, [class*="tel"]')
+                if phone_element:
+                    result['phone'] = phone_element.get_text(strip=True)
+
                 # 홈페이지 URL
-                homepage_elements = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="http"]')
-                for elem in homepage_elements:
-                    href = elem.get_attribute('href')
+                for link in soup.select('a[href*="http"]'):
+                    href = link.get('href')
                     if href and 'naver.com' not in href and 'google.com' not in href:
                         result['homepage'] = href
                         break
-                
-                # 페이지 소스에서 이메일 추출
-                page_source = self.driver.page_source
-                emails = self.email_pattern.findall(page_source)
-                
-                # 유효한 이메일 필터링
-                valid_emails = [
-                    email for email in emails 
-                    if 'naver.com' not in email 
-                    and 'google.com' not in email
-                    and self.is_valid_email(email)  # 검증 추가
-                ]
-                
-                if valid_emails:
-                    result['email'] = valid_emails[0]
-                
+
+                # 보이는 텍스트에서 첫 번째 유효 이메일만 추출
+                # (원본 HTML보다 훨씬 작아 정규식 스캔도 빠름)
+                result['email'] = self.first_valid_email(soup.get_text(' '))
+
             except Exception as e:
                 logger.warning(f"플레이스 정보 추출 중 오류: {e}")
-            
-            # 메모리 정리
-            try:
-                self.driver.execute_script("window.stop();")
-                self.driver.delete_all_cookies()
-            except:
-                pass
-            
+
             return result
-            
+
         except Exception as e:
             logger.error(f"네이버 검색 실패 ({company_name}): {e}")
-            return {'email': None, 'homepage': None, 'phone': None}
+            return result
     
-    def extract_email_from_website(self, url):
+    def first_valid_email(self, text):
         """
-        회사 홈페이지에서 이메일 추출
-        
+        본문에서 첫 번째 유효 이메일을 찾으면 즉시 중단
+
+        findall처럼 모든 매치를 리스트로 만들지 않고 finditer로
+        순회하다가 첫 번째 유효 이메일에서 바로 반환한다.
+        """
+        for match in EMAIL_RE.finditer(text):
+            email = match.group(0)
+            if not EXCLUDE_DOMAINS_RE.search(email) and self.is_valid_email(email):
+                return email
+        return None
+
+    def _email_from_mailto(self, soup):
+        """
+        mailto: 링크에서 이메일 추출
+
+        mailto 링크는 사이트가 직접 명시한 확정 데이터이므로
+        본문 정규식 스캔보다 우선한다.
+        """
+        return self._pick_email(
+            a.get('href', '')[7:].split('?')[0]
+            for a in soup.select("a[href^='mailto:']")
+        )
+
+    def _pick_email(self, candidates):
+        """
+        후보를 한 번만 순회하며 대표성 높은 계정(info@, ceo@ 등)을 우선 선택
+
+        우선순위 계정이 나오면 즉시 반환하고, 없으면 첫 번째 유효
+        이메일을 반환한다.
+        """
+        first = None
+        for email in candidates:
+            if not self.is_valid_email(email):
+                continue
+            if PRIORITY_RE.search(email):
+                return email
+            if first is None:
+                first = email
+        return first
+
+    def _select_email(self, text):
+        """본문에서 이메일 선택: mailto 주소(확정 데이터) 우선, 이후 전체 스캔"""
+        return (
+            self._pick_email(m.group(1) for m in MAILTO_RE.finditer(text))
+            or self._pick_email(m.group(0) for m in EMAIL_RE.finditer(text))
+        )
+
+    async def extract_email_from_website(self, url):
+        """
+        회사 홈페이지에서 이메일 추출 (HTTP 우선, JS 렌더링 페이지만 Selenium 폴백)
+
         Args:
             url: 홈페이지 URL
-            
+
         Returns:
             str: 이메일 주소 또는 None
         """
-        try:
-            if not url:
+        if not url:
+            return None
+
+        # URL 정규화
+        if not url.startswith('http'):
+            url = 'http://' + url
+
+        # 1차: 단순 HTTP 요청 (Chromium 페이지 로드보다 수십 배 빠름)
+        html = await self.fetch(url)
+
+        if html and len(html) >= MIN_HTML_LEN:
+            # 연락처가 들어가는 태그만 파싱 (전체 DOM 대비 입력이 크게 줄어듦)
+            soup = BeautifulSoup(html, 'lxml', parse_only=CONTACT_STRAINER)
+
+            # 링크가 하나도 없으면 JS 렌더링 페이지일 가능성이 높음
+            if soup.find('a'):
+                # mailto 링크 우선, 없으면 텍스트 정규식 스캔
+                email = self._email_from_mailto(soup) or self._select_email(soup.get_text(' '))
+                if email:
+                    return email
+
+                # 연락처/회사소개 페이지도 HTTP로 확인
+                for link in soup.find_all('a', string=CONTACT_LINK_RE):
+                    href = link.get('href')
+                    if not href:
+                        continue
+                    contact_html = await self.fetch(urljoin(url, href))
+                    if contact_html:
+                        contact_soup = BeautifulSoup(
+                            contact_html, 'lxml', parse_only=CONTACT_STRAINER
+                        )
+                        email = (
+                            self._email_from_mailto(contact_soup)
+                            or self._select_email(contact_soup.get_text(' '))
+                        )
+                        if email:
+                            return email
+                    break  # 첫 번째 연락처 링크만 확인 (기존 동작과 동일)
+
                 return None
-            
-            # URL 정규화
-            if not url.startswith('http'):
-                url = 'http://' + url
-            
-            self.driver.get(url)
-            time.sleep(2)
-            
-            # 연락처/Contact 페이지 찾기
-            contact_links = self.driver.find_elements(
-                By.XPATH, 
-                "//a[contains(text(), '연락') or contains(text(), 'Contact') or contains(text(), '회사소개')]"
+
+        # 2차: JS 렌더링이 필요한 페이지는 Selenium으로 폴백
+        email, contact_hrefs = await asyncio.to_thread(
+            self._extract_with_pooled_driver, url
+        )
+        if email:
+            return email
+
+        # 연락처 후보 페이지는 클릭-전환 없이 HTTP로 직접 확인
+        # (드라이버는 이미 반납됐고, 여러 후보를 병렬 파이프라인과 함께 소화)
+        for href in contact_hrefs[:3]:
+            if not href.startswith('http'):
+                continue
+            contact_html = await self.fetch(href)
+            if contact_html:
+                contact_soup = BeautifulSoup(
+                    contact_html, 'lxml', parse_only=CONTACT_STRAINER
+                )
+                email = (
+                    self._email_from_mailto(contact_soup)
+                    or self._select_email(contact_soup.get_text(' '))
+                )
+                if email:
+                    return email
+
+        return None
+
+    def _extract_with_pooled_driver(self, url):
+        """풀에서 드라이버를 빌려 이메일 추출 후 반납 (스레드에서 실행)"""
+        if self._pool_size == 0:
+            # 풀이 아예 구성되지 않은 경우 (setup_selenium 실패 등)
+            logger.warning(f"드라이버 풀이 없어 Selenium 폴백 생략: {url}")
+            return None, []
+
+        driver = self.drivers.get()
+        try:
+            return self._extract_email_with_driver(driver, url)
+        finally:
+            self.drivers.put(driver)
+
+    def _extract_email_with_driver(self, driver, url):
+        """
+        Selenium으로 홈페이지에서 이메일 추출 (JS 렌더링 폴백 경로)
+
+        이메일을 찾지 못하면 연락처 후보 링크의 href 목록을 함께
+        반환한다. 후보 페이지는 느린 XPath 클릭-전환 대신 호출 쪽에서
+        HTTP로 직접 가져온다.
+
+        Args:
+            driver: 풀에서 빌린 Chrome 드라이버
+            url: 홈페이지 URL (정규화된 상태)
+
+        Returns:
+            tuple: (이메일 또는 None, 연락처 후보 href 리스트)
+        """
+        try:
+            driver.get(url)
+
+            # 고정 sleep 대신 DOM 조건 대기 (빨리 뜨는 페이지는 바로 진행).
+            # eager 로드 전략에서는 DOMContentLoaded 시점에 get()이 반환되어
+            # body는 항상 이미 존재하므로, JS 렌더링이 실제로 콘텐츠를
+            # 그렸다는 신호인 링크 출현을 기다린다 (이 폴백 경로는
+            # HTTP로는 빈 껍데기였던 페이지만 들어온다)
+            try:
+                WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "a[href^='http']")
+                    )
+                )
+            except Exception:
+                pass  # 끝내 링크가 안 그려지는 페이지는 현재 상태로 진행
+
+            # 보이는 텍스트 + mailto 링크 + 연락처 후보 href를
+            # execute_script 1회로 전부 회수 (XPath 텍스트 검색보다 빠름)
+            text, contact_hrefs = driver.execute_script(
+                "return ["
+                "(document.body ? document.body.innerText : '') + '\\n' + "
+                "Array.from(document.querySelectorAll('a[href^=\"mailto:\"]'))"
+                ".map(a => a.href).join('\\n'),"
+                "Array.from(document.querySelectorAll('a'))"
+                ".filter(a => /연락|Contact|회사소개|문의/i.test(a.textContent))"
+                ".map(a => a.href)"
+                "];"
             )
-            
-            if contact_links:
-                contact_links[0].click()
-                time.sleep(2)
-            
-            # 페이지에서 이메일 추출
-            page_source = self.driver.page_source
-            emails = self.email_pattern.findall(page_source)
-            
-            # 유효한 이메일만 필터링
-            emails = [email for email in emails if self.is_valid_email(email)]
-            
+
             # 메모리 정리
             try:
-                self.driver.execute_script("window.stop();")
-                self.driver.delete_all_cookies()
+                driver.execute_script("window.stop();")
+                driver.delete_all_cookies()
             except:
                 pass
-            
-            # 유효한 이메일 필터링 (info@, ceo@, contact@ 등 우선)
-            priority_keywords = ['ceo', 'info', 'contact', 'admin', 'master']
-            
-            for keyword in priority_keywords:
-                for email in emails:
-                    if keyword in email.lower():
-                        return email
-            
-            # 우선순위 키워드가 없으면 첫 번째 이메일 반환
-            if emails:
-                return emails[0]
-            
-            return None
-            
+
+            return self._select_email(text or ''), (contact_hrefs or [])
+
         except Exception as e:
             logger.warning(f"홈페이지 이메일 추출 실패 ({url}): {e}")
-            return None
+            return None, []
     
-    def find_email(self, company_name, representative=None):
+    def _cache_result(self, cache_key, result):
+        """검색 결과를 타임스탬프와 함께 디스크 캐시에 저장"""
+        if self.cache is not None:
+            self.cache[cache_key] = (time.time(), result)
+
+    async def find_email(self, company_name, representative=None):
         """
         회사 이메일 찾기 (네이버 + 홈페이지)
-        
+
         Args:
             company_name: 회사명
             representative: 대표자명 (선택)
-            
+
         Returns:
             dict: {email, source, source_url, confidence}
         """
+        # 디스크 캐시 확인 (TTL 이내면 크롤링 생략)
+        cache_key = normalize_company_name(company_name)
+        if self.cache is not None and cache_key in self.cache:
+            cached_at, cached_result = self.cache[cache_key]
+            # 미발견 결과는 짧은 TTL 적용 (일시적 오류였다면 재시도)
+            ttl = self._cache_ttl if cached_result.get('email') else self._negative_cache_ttl
+            if time.time() - cached_at < ttl:
+                logger.info(f"💾 캐시 적중: {company_name}")
+                return cached_result
+
         logger.info(f"🔍 검색 시작: {company_name}")
-        
+
         result = {
             'email': None,
             'source': None,
             'source_url': None,
             'confidence': 'LOW'
         }
-        
+
         # 1단계: 네이버 플레이스/지도 검색
-        naver_result = self.search_naver_place(company_name)
-        
+        naver_result = await self.search_naver_place(company_name)
+
         if naver_result['email']:
             result['email'] = naver_result['email']
             result['source'] = '네이버 플레이스'
-            result['source_url'] = f"https://search.naver.com/search.naver?query={company_name}"
+            result['source_url'] = f"https://search.naver.com/search.naver?query={quote(company_name)}"
             result['confidence'] = 'HIGH'
             logger.info(f"✅ 네이버에서 이메일 발견: {result['email']}")
+            self._cache_result(cache_key, result)
             return result
-        
-        # 2단계: 홈페이지에서 이메일 추출
+
+        # 2단계: 홈페이지에서 이메일 추출 (HTTP 우선, 필요 시 Selenium 폴백)
         if naver_result['homepage']:
-            website_email = self.extract_email_from_website(naver_result['homepage'])
+            website_email = await self.extract_email_from_website(
+                naver_result['homepage']
+            )
             if website_email:
                 result['email'] = website_email
                 result['source'] = '회사 홈페이지'
                 result['source_url'] = naver_result['homepage']
                 result['confidence'] = 'MEDIUM'
                 logger.info(f"✅ 홈페이지에서 이메일 발견: {result['email']}")
+                self._cache_result(cache_key, result)
                 return result
-        
+
         logger.warning(f"⚠️ 이메일을 찾지 못함: {company_name}")
+        self._cache_result(cache_key, result)
         return result
     
-    def add_email_column(self):
-        """구글시트에 이메일 컬럼 추가"""
+    def add_email_column(self, headers=None):
+        """
+        구글시트에 이메일 컬럼 추가
+
+        Args:
+            headers: 이미 읽어 둔 헤더 행 (None이면 API로 조회)
+        """
         try:
-            # 현재 헤더 가져오기
-            headers = self.sheet.row_values(1)
-            
+            # 현재 헤더 가져오기 (호출자가 읽은 값이 있으면 재조회하지 않음)
+            if headers is None:
+                headers = self.sheet.row_values(1)
+
             # 이미 이메일 컬럼이 있는지 확인
             if '대표이메일(자동수집)' in headers:
                 logger.info("이메일 컬럼이 이미 존재합니다")
                 return headers.index('대표이메일(자동수집)') + 1
             
-            # 새 컬럼 추가
+            # 새 컬럼 추가 (4개 헤더를 한 번의 API 호출로 기록)
             new_col_index = len(headers) + 1
-            self.sheet.update_cell(1, new_col_index, '대표이메일(자동수집)')
-            self.sheet.update_cell(1, new_col_index + 1, '수집출처')
-            self.sheet.update_cell(1, new_col_index + 2, '출처URL')
-            self.sheet.update_cell(1, new_col_index + 3, '신뢰도')
+            header_range = self._row_range(1, new_col_index)
+            self.sheet.update(
+                header_range,
+                [['대표이메일(자동수집)', '수집출처', '출처URL', '신뢰도']]
+            )
             
             logger.info(f"✅ 이메일 컬럼 추가 완료 (컬럼 {new_col_index})")
             return new_col_index
@@ -405,102 +693,237 @@ class EmailCrawler:
             logger.error(f"❌ 컬럼 추가 실패: {e}")
             return None
     
-    def crawl_all_companies(self, start_row=2, end_row=None, batch_size=5):
+    @staticmethod
+    def _row_range(row_num, start_col, width=4):
+        """행 내 연속 셀 구간을 A1 표기 범위로 반환 (예: D5:G5)"""
+        return (
+            f"{gspread.utils.rowcol_to_a1(row_num, start_col)}"
+            f":{gspread.utils.rowcol_to_a1(row_num, start_col + width - 1)}"
+        )
+
+    def flush_updates(self, updates):
+        """누적된 셀 업데이트를 한 번의 batch_update API 호출로 기록"""
+        if not updates:
+            return
+        try:
+            self.sheet.batch_update(updates, value_input_option='RAW')
+            logger.info(f"💾 구글 시트 일괄 업데이트 완료 ({len(updates)}행)")
+            updates.clear()
+        except Exception as e:
+            logger.error(f"❌ 시트 일괄 업데이트 실패: {e}")
+            raise
+
+    async def _flush_updates_async(self, updates):
         """
-        전체 회사 리스트 크롤링 (배치 처리)
-        
+        쓰기 배치를 스레드에서 실행 (이벤트 루프 블로킹 방지)
+
+        쿼터 초과(429)는 크롤링을 멈추지 않고 쓰기 쪽에서만 대기 후
+        재시도한다 (백프레셔).
+        """
+        while updates:
+            try:
+                await asyncio.to_thread(self.flush_updates, updates)
+            except gspread.exceptions.APIError as e:
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                if status == 429:
+                    logger.warning("⏳ 시트 쓰기 쿼터 초과, 30초 후 재시도")
+                    await asyncio.sleep(30)
+                else:
+                    raise
+
+    async def crawl_all_companies(self, start_row=2, end_row=None, concurrency=10):
+        """
+        전체 회사 리스트 크롤링 (asyncio 동시 처리)
+
         Args:
             start_row: 시작 행 (기본값: 2, 헤더 제외)
             end_row: 종료 행 (None이면 전체)
-            batch_size: 배치 크기 (기본값: 5, 메모리 절약)
+            concurrency: 동시 처리할 회사 수 (기본값: 10)
         """
+        # 시트 쓰기는 행마다 호출하지 않고 모아서 일괄 처리 (API 쿼터 절약)
+        updates = []
+        flush_every = 50
+
         try:
+            # 전체 데이터 1회 조회 (헤더도 여기서 함께 확보, 세션 내 캐시)
+            all_data = self._sheet_cache
+            if all_data is None:
+                all_data = self.sheet.get_all_values()
+                self._sheet_cache = all_data
+
+            if not all_data:
+                logger.warning("⚠️ 시트에 데이터가 없습니다")
+                return
+
             # 이메일 컬럼 추가
-            email_col = self.add_email_column()
+            email_col = self.add_email_column(headers=all_data[0])
             if not email_col:
                 return
-            
-            # 전체 데이터 가져오기
-            all_data = self.sheet.get_all_values()
-            
+
             if end_row is None:
                 end_row = len(all_data)
             
             total_count = end_row - start_row + 1
             success_count = 0
             
-            logger.info(f"📊 총 {total_count}개 회사 크롤링 시작 (배치 크기: {batch_size})")
-            
-            # 환경 변수에서 딜레이 시간 가져오기
-            crawl_delay = int(os.getenv('CRAWL_DELAY', '3'))
-            
-            # 배치 단위로 처리
-            for batch_start in range(start_row - 1, end_row, batch_size):
-                batch_end = min(batch_start + batch_size, end_row)
-                batch_num = (batch_start - start_row + 1) // batch_size + 1
-                total_batches = (total_count + batch_size - 1) // batch_size
-                
-                logger.info(f"\n{'='*60}")
-                logger.info(f"📦 배치 {batch_num}/{total_batches} 처리 중 ({batch_end - batch_start}개)")
-                logger.info(f"{'='*60}")
-                
-                for idx in range(batch_start, batch_end):
-                    row_num = idx + 1
-                    row_data = all_data[idx]
-                    
-                    # 회사명 (B열)
-                    company_name = row_data[1] if len(row_data) > 1 else None
-                    # 대표자명 (C열)
-                    representative = row_data[2] if len(row_data) > 2 else None
-                    
-                    if not company_name:
+            logger.info(f"📊 총 {total_count}개 회사 크롤링 시작 (동시 처리: {concurrency}개)")
+
+            # RETRY_MISSING=1 이면 '미발견' 행만 다시 크롤링
+            retry_missing = os.getenv('RETRY_MISSING', '0') == '1'
+
+            # 크롤링 대상 행 수집 (이미 채워진 행은 건너뛰어 증분 실행)
+            targets = []
+            skipped = 0
+            for idx in range(start_row - 1, end_row):
+                row_data = all_data[idx]
+
+                # 회사명 (B열)
+                company_name = row_data[1] if len(row_data) > 1 else None
+                # 대표자명 (C열)
+                representative = row_data[2] if len(row_data) > 2 else None
+
+                if not company_name:
+                    continue
+
+                # 이메일 컬럼이 이미 채워진 행은 재크롤링하지 않음
+                existing = row_data[email_col - 1].strip() if len(row_data) >= email_col else ''
+                if existing and (existing != '미발견' or not retry_missing):
+                    skipped += 1
+                    continue
+
+                targets.append((idx + 1, company_name, representative))
+
+            if skipped:
+                logger.info(f"⏭️  이미 처리된 {skipped}개 행 건너뜀")
+
+            if not targets:
+                logger.info("✅ 새로 크롤링할 행이 없습니다")
+                return
+
+            # 동일(정규화된) 회사명은 1회만 크롤링하고 결과를 전 행에 복사
+            unique_targets = {}
+            for row_num, name, rep in targets:
+                key = normalize_company_name(name)
+                if key in unique_targets:
+                    unique_targets[key]['rows'].append(row_num)
+                else:
+                    unique_targets[key] = {'name': name, 'rep': rep, 'rows': [row_num]}
+
+            duplicates = len(targets) - len(unique_targets)
+            if duplicates:
+                logger.info(f"🔁 중복 회사명 {duplicates}개는 1회만 크롤링합니다")
+
+            # 생산자(크롤 워커 N개) / 소비자(시트 기록 1개) 파이프라인:
+            # 크롤링과 시트 쓰기는 병목이 달라 큐로 분리한다
+            input_q = asyncio.Queue()
+            for entry in unique_targets.values():
+                input_q.put_nowait(entry)
+            results_q = asyncio.Queue()
+
+            done_count = 0
+            total_unique = len(unique_targets)
+
+            async def crawl_worker():
+                """입력 큐에서 회사를 꺼내 크롤링하고 결과 큐에 적재"""
+                while True:
+                    try:
+                        entry = input_q.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    result = await self.find_email(entry['name'], entry['rep'])
+                    await results_q.put((entry['rows'], result))
+
+            async def sheet_writer():
+                """결과 큐를 비우며 일괄 기록 (50행 또는 5초 단위)"""
+                nonlocal done_count, success_count
+                while done_count < total_unique:
+                    try:
+                        row_nums, result = await asyncio.wait_for(
+                            results_q.get(), timeout=5.0
+                        )
+                    except asyncio.TimeoutError:
+                        # 새 결과가 잠잠하면 모인 것부터 기록
+                        await self._flush_updates_async(updates)
                         continue
-                    
-                    progress = idx - start_row + 2
-                    logger.info(f"\n[{progress}/{total_count}] 처리 중: {company_name}")
-                    
-                    # 이메일 검색
-                    result = self.find_email(company_name, representative)
-                    
-                    # 결과 업데이트
+
+                    done_count += 1
+                    logger.info(f"[{done_count}/{total_unique}] 완료: 행 {row_nums}")
+
                     if result['email']:
-                        self.sheet.update_cell(row_num, email_col, result['email'])
-                        self.sheet.update_cell(row_num, email_col + 1, result['source'])
-                        self.sheet.update_cell(row_num, email_col + 2, result['source_url'] or '')
-                        self.sheet.update_cell(row_num, email_col + 3, result['confidence'])
-                        success_count += 1
+                        row_values = [
+                            result['email'],
+                            result['source'],
+                            result['source_url'] or '',
+                            result['confidence']
+                        ]
+                        success_count += len(row_nums)
                     else:
-                        self.sheet.update_cell(row_num, email_col, '미발견')
-                        self.sheet.update_cell(row_num, email_col + 1, '')
-                        self.sheet.update_cell(row_num, email_col + 2, '')
-                        self.sheet.update_cell(row_num, email_col + 3, 'NONE')
-                    
-                    # API 제한 방지를 위한 대기
-                    time.sleep(crawl_delay)
-                
-                # 배치 처리 완료 후 브라우저 정리 (메모리 절약)
-                if batch_end < end_row:
-                    logger.info(f"\n🔄 메모리 정리 중... (다음 배치 준비)")
-                    if self.driver:
-                        self.driver.quit()
-                    time.sleep(2)
-                    # 다음 배치를 위해 드라이버 재시작
-                    if not self.setup_selenium():
-                        logger.error("Selenium 재시작 실패")
-                        return
-            
+                        row_values = ['미발견', '', '', 'NONE']
+
+                    # 결과를 해당하는 모든 행에 복사 (행당 연속 4셀을 한 범위로)
+                    for row_num in row_nums:
+                        updates.append({
+                            'range': self._row_range(row_num, email_col),
+                            'values': [row_values]
+                        })
+
+                    # 일정 개수마다 일괄 기록 (쿼터 초과 방지)
+                    if len(updates) >= flush_every:
+                        await self._flush_updates_async(updates)
+
+                # 남은 업데이트 일괄 기록
+                await self._flush_updates_async(updates)
+
+            # HTTP/2 + keep-alive 공유 클라이언트로 워커와 기록 태스크 동시 실행
+            # (요청마다 TLS 핸드셰이크를 반복하지 않도록 커넥션 풀을 명시 튜닝)
+            async with httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                timeout=10,
+                headers={'User-Agent': USER_AGENT},
+            ) as client:
+                self.client = client
+                try:
+                    workers = [
+                        crawl_worker()
+                        for _ in range(min(concurrency, total_unique))
+                    ]
+                    await asyncio.gather(*workers, sheet_writer())
+                finally:
+                    self.client = None
+
             logger.info(f"\n✅ 크롤링 완료!")
-            logger.info(f"📊 성공: {success_count}/{total_count} ({success_count/total_count*100:.1f}%)")
+            logger.info(f"📊 성공: {success_count}/{len(targets)} ({success_count/len(targets)*100:.1f}%)")
             
         except Exception as e:
             logger.error(f"❌ 크롤링 중 오류 발생: {e}")
+            # 중단 전에 누적된 결과라도 기록 시도
+            try:
+                self.flush_updates(updates)
+            except Exception:
+                pass
             raise
     
     def close(self):
-        """리소스 정리"""
-        if self.driver:
-            self.driver.quit()
-            logger.info("✅ 브라우저 종료")
+        """리소스 정리 (캐시 동기화, 대여 중인 드라이버 포함 풀 전체 종료)"""
+        if self.cache is not None:
+            try:
+                self.cache.close()
+                logger.info("💾 디스크 캐시 저장 완료")
+            except Exception:
+                pass
+            self.cache = None
+        closed = 0
+        for driver in self._all_drivers:
+            try:
+                driver.quit()
+                closed += 1
+            except Exception:
+                pass
+        self._all_drivers.clear()
+        self._pool_size = 0
+        if closed:
+            logger.info(f"✅ 브라우저 종료 ({closed}개)")
 
 
 def main():
@@ -511,8 +934,8 @@ def main():
         SPREADSHEET_KEY = os.getenv('SPREADSHEET_KEY')
         CREDENTIALS_JSON = os.getenv('GOOGLE_SHEETS_CREDENTIALS')
         START_ROW = int(os.getenv('START_ROW', '2'))
-        BATCH_SIZE = int(os.getenv('BATCH_SIZE', '5'))  # 기본값: 5개씩 (메모리 절약)
-        
+        CONCURRENCY = int(os.getenv('CONCURRENCY', '10'))  # 동시 처리 회사 수
+
         if not SPREADSHEET_KEY:
             raise ValueError("SPREADSHEET_KEY 환경 변수가 설정되지 않았습니다")
         
@@ -523,8 +946,7 @@ def main():
         logger.info("🚀 이메일 크롤러 시작 (Render 모드)")
         logger.info("=" * 60)
         logger.info(f"📊 구글 시트 ID: {SPREADSHEET_KEY[:20]}...")
-        logger.info(f"⏱️  크롤링 딜레이: {os.getenv('CRAWL_DELAY', '3')}초")
-        logger.info(f"📦 배치 크기: {BATCH_SIZE}개 (메모리 절약)")
+        logger.info(f"⚡ 동시 처리: {CONCURRENCY}개")
         logger.info("=" * 60)
         
         # 크롤러 초기화
@@ -545,7 +967,9 @@ def main():
         
         # 전체 크롤링 실행
         logger.info("\n📝 크롤링을 시작합니다...\n")
-        crawler.crawl_all_companies(start_row=START_ROW, batch_size=BATCH_SIZE)
+        asyncio.run(
+            crawler.crawl_all_companies(start_row=START_ROW, concurrency=CONCURRENCY)
+        )
         
         logger.info("\n" + "=" * 60)
         logger.info("✅ 모든 작업이 완료되었습니다!")